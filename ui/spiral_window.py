@@ -10,6 +10,8 @@ This expands the minimal prototype to:
 
 Dependencies:
 - tkinter (stdlib)
+- numpy
+- numba (optional; JIT-compiles batch_hit_test)
 
 Run:
   python -m ui.spiral_window
@@ -19,28 +21,111 @@ import json
 import math
 import time
 import tkinter as tk
-from dataclasses import dataclass, field
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, font as tkfont
 from typing import Callable, List, Optional, Tuple, Dict, Any
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+
+# Child layout offsets for _expand_choice. They depend only on the parent
+# level and the child index, so compute the (dx, dy) table once.
+CHILDREN_PER_EXPAND = 4
+MAX_LEVEL = 2
+
+
+def _child_offsets(level: int) -> np.ndarray:
+    i = np.arange(CHILDREN_PER_EXPAND)
+    angles = i * (math.pi / 3) + level * 0.7
+    dists = 70 + 20 * i
+    return np.column_stack((dists * np.cos(angles), dists * np.sin(angles)))
+
+
+_CHILD_OFFSETS: Dict[int, np.ndarray] = {lvl: _child_offsets(lvl) for lvl in range(MAX_LEVEL + 1)}
+
+# Delay before buffered log/agent lines are written to their Text widgets.
+LOG_FLUSH_MS = 50
+# Pending log entries beyond this are dropped, oldest half first.
+LOG_BUF_MAX = 1000
+# Compact encoder for log lines, built once instead of per json.dumps call
+_encode = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+# -----------------------------
+# Batch hit-testing
+# -----------------------------
+
+def _hit_test_batch_numpy(px, py, cx, cy, r2, out):
+    inside = (px[:, None] - cx) ** 2 + (py[:, None] - cy) ** 2 <= r2
+    # Index of the last (topmost) hit per point, -1 for none
+    last = cx.size - 1 - np.argmax(inside[:, ::-1], axis=1)
+    out[:] = np.where(inside.any(axis=1), last, -1)
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _hit_test_batch(px, py, cx, cy, r2, out):
+        for i in prange(px.size):
+            out[i] = -1
+            for j in range(cx.size - 1, -1, -1):
+                dx = px[i] - cx[j]
+                dy = py[i] - cy[j]
+                if dx * dx + dy * dy <= r2[j]:
+                    out[i] = j
+                    break
+else:
+    _hit_test_batch = _hit_test_batch_numpy
+
 # -----------------------------
 # Data models
 # -----------------------------
 
-@dataclass
 class Choice:
-    label: str
-    x: float
-    y: float
-    level: int = 0
-    parent: Optional["Choice"] = None
-    radius: int = 36
-    selected: bool = False
-    meta: Dict[str, Any] = field(default_factory=dict)
-    children: List["Choice"] = field(default_factory=list)
+    """A selectable node. Uses __slots__ since a fully expanded tree holds a
+    few hundred of these; ``meta`` is only allocated when something needs it.
+    """
+
+    __slots__ = (
+        "label", "x", "y", "level", "parent", "radius", "selected", "meta", "children",
+        "_r2", "oval_id", "text_id", "line_id",
+    )
+
+    def __init__(
+        self,
+        label: str,
+        x: float,
+        y: float,
+        level: int = 0,
+        parent: Optional["Choice"] = None,
+        radius: int = 36,
+        selected: bool = False,
+        meta: Optional[Dict[str, Any]] = None,
+    ):
+        self.label = label
+        self.x = x
+        self.y = y
+        self.level = level
+        self.parent = parent
+        self.radius = radius
+        self.selected = selected
+        self.meta = meta
+        self.children: List[Choice] = []
+        self._r2 = radius * radius
+        # Canvas item ids, set while the choice is drawn
+        self.oval_id: Optional[int] = None
+        self.text_id: Optional[int] = None
+        self.line_id: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f"Choice(label={self.label!r}, x={self.x:.1f}, y={self.y:.1f}, level={self.level})"
 
     def is_point_inside(self, px: float, py: float) -> bool:
-        return math.hypot(px - self.x, py - self.y) <= self.radius
+        # Compare squared distances; no sqrt needed
+        dx = px - self.x
+        dy = py - self.y
+        return dx * dx + dy * dy <= self._r2
 
 
 # -----------------------------
@@ -52,20 +137,18 @@ class AletheiaAgent:
     Replace this with a real agent API later.
     """
 
+    # Response templates per event, filled from the event payload
+    _TMPL: Dict[str, str] = {
+        "expand": "Aletheia: Expanding '{label}' at level {level}. Consider related intents.",
+        "collapse": "Aletheia: Collapsed '{label}'. Backtracked to parent context.",
+        "select": "Aletheia: You selected '{label}'. Next: confirm parameters or branch.",
+        "hover": "Aletheia: Hovering over '{label}'.",
+        "reset": "Aletheia: Reset to root choices.",
+    }
+
     def respond(self, event: str, payload: Dict[str, Any]) -> str:
-        label = payload.get("label")
-        level = payload.get("level")
-        if event == "expand":
-            return f"Aletheia: Expanding '{label}' at level {level}. Consider related intents."
-        if event == "collapse":
-            return f"Aletheia: Collapsed '{label}'. Backtracked to parent context."
-        if event == "select":
-            return f"Aletheia: You selected '{label}'. Next: confirm parameters or branch."
-        if event == "hover":
-            return f"Aletheia: Hovering over '{label}'."
-        if event == "reset":
-            return "Aletheia: Reset to root choices."
-        return "Aletheia: Acknowledged."
+        tmpl = self._TMPL.get(event)
+        return tmpl.format_map(payload) if tmpl else "Aletheia: Acknowledged."
 
 
 # -----------------------------
@@ -80,9 +163,25 @@ class SpiralWindow:
 
         # State
         self.choices: List[Choice] = []
-        self.expanded_choice: Optional[Choice] = None
         self.hover_choice: Optional[Choice] = None
+        self._last_hover_logged: Optional[Choice] = None
+        self._motion_pending = False
+        self._last_motion_xy: Tuple[float, float] = (0, 0)
         self.log: List[Dict[str, Any]] = []
+        # Text widget writes are buffered and flushed every LOG_FLUSH_MS
+        self._log_buf: List[Dict[str, Any]] = []
+        self._log_flush_scheduled = False
+        self._agent_buf: List[str] = []
+        self._agent_flush_scheduled = False
+        # Hit-test mirror of the live choices (structure of arrays)
+        self._xs = np.empty(0, dtype=np.float64)
+        self._ys = np.empty(0, dtype=np.float64)
+        self._r2s = np.empty(0, dtype=np.float64)
+        self._choice_by_idx: List[Choice] = []
+        # Hidden canvas items kept for reuse by later expansions
+        self._oval_pool: List[int] = []
+        self._text_pool: List[int] = []
+        self._line_pool: List[int] = []
         self.agent = AletheiaAgent()
 
         # UI
@@ -91,11 +190,15 @@ class SpiralWindow:
 
     # ----- UI setup -----
     def _setup_ui(self):
+        # Named fonts, so Tk parses each font spec once
+        self._header_font = tkfont.Font(root=self.root, family="Segoe UI", size=14, weight="bold")
+        self._choice_font = tkfont.Font(root=self.root, family="Segoe UI", size=10, weight="bold")
+
         # Header
         header = ttk.Frame(self.root)
         header.pack(fill=tk.X, padx=10, pady=6)
 
-        ttk.Label(header, text="Spiral OS", font=("Segoe UI", 14, "bold")).pack(side=tk.LEFT)
+        ttk.Label(header, text="Spiral OS", font=self._header_font).pack(side=tk.LEFT)
         self.info_label = ttk.Label(header, text="Hover or click a choice.")
         self.info_label.pack(side=tk.LEFT, padx=12)
 
@@ -107,6 +210,8 @@ class SpiralWindow:
 
         self.canvas = tk.Canvas(body, bg="#0b0f14", highlightthickness=0)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Center marker; created once and never redrawn
+        self._center_id = self.canvas.create_oval(410, 310, 430, 330, outline="#3a556a", fill="#13202e")
 
         right = ttk.Notebook(body)
         right.pack(side=tk.RIGHT, fill=tk.BOTH, expand=False)
@@ -137,58 +242,138 @@ class SpiralWindow:
 
     # ----- Initial graph -----
     def _create_initial_choices(self):
-        self.choices.clear()
-        self.expanded_choice = None
         center = (420, 320)
         radius = 150
+        node_radius = 34
         labels = [
             "Ask", "Plan", "Do", "Reflect",
             "Share", "Data", "Agents", "Settings",
         ]
-        for i, label in enumerate(labels):
-            angle = (2 * math.pi / len(labels)) * i
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            self.choices.append(Choice(label=label, x=x, y=y, level=0, radius=34))
-        self._draw_choices()
+        angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False)
+        xs = center[0] + radius * np.cos(angles)
+        ys = center[1] + radius * np.sin(angles)
+        self.choices[:] = [
+            Choice(label=label, x=x, y=y, level=0, radius=node_radius)
+            for label, x, y in zip(labels, xs.tolist(), ys.tolist())
+        ]
+        # The layout arrays double as the hit-test arrays
+        self._xs = xs
+        self._ys = ys
+        self._r2s = np.full(len(labels), node_radius * node_radius, dtype=np.float64)
+        self._choice_by_idx = list(self.choices)
+        self._refresh_all()
         self._log_event("init", {"labels": labels})
         self._agent_say("reset", {"labels": labels})
 
     # ----- Drawing -----
-    def _draw_choices(self):
-        self.canvas.delete("all")
-        # Optional: draw center
-        self.canvas.create_oval(410, 310, 430, 330, outline="#3a556a", fill="#13202e")
+    def _refresh_all(self):
+        """Rebuild every choice item. Only used on reset; expand and collapse
+        add or delete the affected items, hover and selection go through
+        _style_choice.
+        """
+        self.canvas.delete("choice")
+        # Pooled items carry the "choice" tag too, so they are gone now
+        self._oval_pool.clear()
+        self._text_pool.clear()
+        self._line_pool.clear()
         for c in self.choices:
             self._draw_choice(c)
 
     def _draw_choice(self, c: Choice):
-        fill = "#1e2a36"
-        outline = "#4ea1ff" if c is self.hover_choice else "#2e4153"
+        c.oval_id, c.text_id, c.line_id = self._create_items(c)
+
+    def _choice_colors(self, c: Choice) -> Tuple[str, str]:
         if c.selected:
-            fill = "#234d20"  # greenish when selected
-            outline = "#58d68d"
+            return "#234d20", "#58d68d"  # greenish when selected
+        outline = "#4ea1ff" if c is self.hover_choice else "#2e4153"
+        return "#1e2a36", outline
+
+    def _create_items(self, c: Choice) -> Tuple[int, int, Optional[int]]:
+        fill, outline = self._choice_colors(c)
+        tags = self._item_tags(c)
         x0, y0 = c.x - c.radius, c.y - c.radius
         x1, y1 = c.x + c.radius, c.y + c.radius
-        self.canvas.create_oval(x0, y0, x1, y1, fill=fill, outline=outline, width=2)
-        self.canvas.create_text(c.x, c.y, text=c.label, fill="#e6eef7", font=("Segoe UI", 10, "bold"))
+        if self._oval_pool:
+            oval_id = self._reuse_item(self._oval_pool, (x0, y0, x1, y1), fill=fill, outline=outline, tags=tags)
+        else:
+            oval_id = self.canvas.create_oval(x0, y0, x1, y1, fill=fill, outline=outline, width=2, tags=tags)
+        if self._text_pool:
+            text_id = self._reuse_item(self._text_pool, (c.x, c.y), text=c.label, tags=tags)
+        else:
+            text_id = self.canvas.create_text(c.x, c.y, text=c.label, fill="#e6eef7", font=self._choice_font, tags=tags)
         # Draw a vector line from parent (if any)
+        line_id = None
         if c.parent is not None:
-            self.canvas.create_line(c.parent.x, c.parent.y, c.x, c.y, fill="#3a7bd5", dash=(3, 3))
+            coords = (c.parent.x, c.parent.y, c.x, c.y)
+            if self._line_pool:
+                line_id = self._reuse_item(self._line_pool, coords, tags=tags)
+            else:
+                line_id = self.canvas.create_line(*coords, fill="#3a7bd5", dash=(3, 3), tags=tags)
+        return oval_id, text_id, line_id
+
+    def _reuse_item(self, pool: List[int], coords: Tuple[float, ...], **options) -> int:
+        """Rebind a hidden pooled item instead of allocating a new one."""
+        item_id = pool.pop()
+        self.canvas.coords(item_id, *coords)
+        self.canvas.itemconfigure(item_id, state="normal", **options)
+        # Keep the stacking order a freshly created item would have
+        self.canvas.tag_raise(item_id)
+        return item_id
+
+    def _item_tags(self, c: Choice) -> Tuple[str, ...]:
+        # Items are tagged with the subtree tag of every ancestor, so a whole
+        # subtree can be hidden with one call on collapse
+        tags = ["choice"]
+        a = c.parent
+        while a is not None:
+            tags.append(self._subtree_tag(a))
+            a = a.parent
+        return tuple(tags)
+
+    @staticmethod
+    def _subtree_tag(c: Choice) -> str:
+        return f"in{id(c)}"
+
+    def _style_choice(self, c: Choice):
+        if c.oval_id is None:
+            return
+        fill, outline = self._choice_colors(c)
+        self.canvas.itemconfigure(c.oval_id, fill=fill, outline=outline)
+
+    def _set_hover(self, choice: Optional[Choice]):
+        old = self.hover_choice
+        self.hover_choice = choice
+        if old is not None:
+            self._style_choice(old)
+        if choice is not None:
+            self._style_choice(choice)
 
     # ----- Interaction handlers -----
     def _on_motion(self, event):
-        choice = self._find_choice_at(event.x, event.y)
-        if choice is not self.hover_choice:
-            self.hover_choice = choice
-            if choice:
-                self.status_var.set(f"Hover: {choice.label}")
-                self.info_label.config(text=f"Hovering over {choice.label} (level {choice.level})")
-                self._agent_say("hover", {"label": choice.label, "level": choice.level})
-            else:
-                self.status_var.set("Ready.")
-                self.info_label.config(text="Hover or click a choice.")
-            self._draw_choices()
+        # Coalesce motion events: only the latest position is hit-tested, once
+        # per idle cycle.
+        self._last_motion_xy = (event.x, event.y)
+        if not self._motion_pending:
+            self._motion_pending = True
+            self.root.after_idle(self._process_motion)
+
+    def _process_motion(self):
+        self._motion_pending = False
+        choice = self._find_choice_at(*self._last_motion_xy)
+        if choice is self.hover_choice:
+            return
+        self._set_hover(choice)
+        if choice is None:
+            self.status_var.set("Ready.")
+            self.info_label.config(text="Hover or click a choice.")
+            return
+        self.status_var.set(f"Hover: {choice.label}")
+        self.info_label.config(text=f"Hovering over {choice.label} (level {choice.level})")
+        # Only tell the agent about a new hover target, not about leaving and
+        # re-entering the same one (e.g. jitter across a circle's edge)
+        if choice is not self._last_hover_logged:
+            self._last_hover_logged = choice
+            self._agent_say("hover", {"label": choice.label, "level": choice.level})
 
     def _on_click(self, event):
         choice = self._find_choice_at(event.x, event.y)
@@ -209,51 +394,81 @@ class SpiralWindow:
                 self._agent_say("expand", {"label": choice.label, "level": choice.level})
             else:
                 choice.selected = not choice.selected
+                self._style_choice(choice)
                 self._handle_choice_selection(choice)
-        self._draw_choices()
 
     def _can_expand(self, choice: Choice) -> bool:
         # You can always expand until level 2 for demo
-        return choice.level < 2
+        return choice.level < MAX_LEVEL
 
     def _expand_choice(self, choice: Choice):
         # Generate 4 child choices in a small spiral around the parent
         r0 = max(18, choice.radius - 8)
-        for i in range(4):
-            angle = (i * (math.pi / 3)) + (choice.level * 0.7)
-            dist = 70 + 20 * i
-            x = choice.x + dist * math.cos(angle)
-            y = choice.y + dist * math.sin(angle)
+        for i, (dx, dy) in enumerate(_CHILD_OFFSETS[choice.level].tolist()):
             child = Choice(
                 label=f"{choice.label}:{i+1}",
-                x=x,
-                y=y,
+                x=choice.x + dx,
+                y=choice.y + dy,
                 level=choice.level + 1,
                 parent=choice,
                 radius=r0,
             )
             choice.children.append(child)
             self.choices.append(child)
+            self._draw_choice(child)
+        self._rebuild_hit_arrays()
 
     def _collapse_choice(self, choice: Choice):
-        # remove all descendants from flat list
-        def collect_desc(c: Choice, acc: List[Choice]):
-            for ch in c.children:
-                acc.append(ch)
-                collect_desc(ch, acc)
-        to_remove: List[Choice] = []
-        collect_desc(choice, to_remove)
-        for ch in to_remove:
-            if ch in self.choices:
-                self.choices.remove(ch)
+        # Collect all descendants with an explicit stack, then rebuild the
+        # flat list in place. Their canvas items are hidden with one call and
+        # returned to the pools for the next expansion.
+        to_remove = set()
+        stack = list(choice.children)
+        while stack:
+            c = stack.pop()
+            to_remove.add(id(c))
+            self._oval_pool.append(c.oval_id)
+            self._text_pool.append(c.text_id)
+            if c.line_id is not None:
+                self._line_pool.append(c.line_id)
+            c.oval_id = c.text_id = c.line_id = None
+            stack.extend(c.children)
+        self.choices[:] = [c for c in self.choices if id(c) not in to_remove]
+        if to_remove:
+            self.canvas.itemconfigure(self._subtree_tag(choice), state="hidden")
         choice.children.clear()
+        self._rebuild_hit_arrays()
+
+    # ----- Hit testing -----
+    def _rebuild_hit_arrays(self):
+        """Mirror (x, y, r²) of self.choices into parallel arrays so a hit-test
+        is one vectorized comparison instead of a Python loop."""
+        n = len(self.choices)
+        self._xs = np.fromiter((c.x for c in self.choices), dtype=np.float64, count=n)
+        self._ys = np.fromiter((c.y for c in self.choices), dtype=np.float64, count=n)
+        self._r2s = np.fromiter((c._r2 for c in self.choices), dtype=np.float64, count=n)
+        self._choice_by_idx = list(self.choices)
+
+    def batch_hit_test(self, points: np.ndarray) -> np.ndarray:
+        """Hit-test an (M, 2) array of canvas points against the live choices.
+        Returns an int64 array of indices into self.choices (topmost hit), -1
+        where a point hits nothing. Meant for ND overlays projecting many
+        samples; uses a Numba kernel when numba is installed.
+        """
+        pts = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+        out = np.empty(len(pts), dtype=np.int64)
+        if self._xs.size == 0:
+            out.fill(-1)
+            return out
+        _hit_test_batch(pts[:, 0].copy(), pts[:, 1].copy(), self._xs, self._ys, self._r2s, out)
+        return out
 
     def _find_choice_at(self, x: float, y: float) -> Optional[Choice]:
-        # Iterate from topmost to bottom
-        for c in reversed(self.choices):
-            if c.is_point_inside(x, y):
-                return c
-        return None
+        dx = self._xs - x
+        dy = self._ys - y
+        hits = np.flatnonzero(dx * dx + dy * dy <= self._r2s)
+        # Later entries are drawn on top, so the last hit wins
+        return self._choice_by_idx[hits[-1]] if hits.size else None
 
     def _handle_choice_selection(self, choice: Choice):
         self._log_event("select", {"label": choice.label, "level": choice.level, "selected": choice.selected})
@@ -267,19 +482,46 @@ class SpiralWindow:
 
     # ----- Logging -----
     def _log_event(self, etype: str, data: Dict[str, Any]):
-        entry = {"t": time.time(), "type": etype, **data}
+        entry = {"t": time.time(), "type": etype}
+        entry.update(data)
         self.log.append(entry)
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", json.dumps(entry) + "\n")
-        self.log_text.see("end")
-        self.log_text.configure(state="disabled")
+        self._log_buf.append(entry)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        if len(self._log_buf) > LOG_BUF_MAX:
+            del self._log_buf[:len(self._log_buf) // 2]
+        # Serialize only here, once per flush
+        text = "\n".join(map(_encode, self._log_buf)) + "\n"
+        self._log_buf.clear()
+        self._append_text(self.log_text, text)
 
     def _agent_say(self, event: str, payload: Dict[str, Any]):
         msg = self.agent.respond(event, payload)
-        self.agent_text.configure(state="normal")
-        self.agent_text.insert("end", msg + "\n")
-        self.agent_text.see("end")
-        self.agent_text.configure(state="disabled")
+        self._agent_buf.append(msg + "\n")
+        if not self._agent_flush_scheduled:
+            self._agent_flush_scheduled = True
+            self.root.after(LOG_FLUSH_MS, self._flush_agent)
+
+    def _flush_agent(self):
+        self._agent_flush_scheduled = False
+        text = "".join(self._agent_buf)
+        self._agent_buf.clear()
+        self._append_text(self.agent_text, text)
+
+    @staticmethod
+    def _append_text(widget: tk.Text, text: str):
+        if not text:
+            return
+        widget.configure(state="normal")
+        widget.insert("end", text)
+        widget.see("end")
+        widget.configure(state="disabled")
 
     # ----- ND extension hooks -----
     def add_nd_dimension(self, name: str, renderer: Callable[[tk.Canvas, List[Choice]], None]):
@@ -287,6 +529,10 @@ class SpiralWindow:
         additional interaction layers. For now this is a placeholder; call renderer
         immediately with current choices.
         """
+        # Choice.meta is allocated lazily; overlays get a dict to annotate
+        for c in self.choices:
+            if c.meta is None:
+                c.meta = {}
         renderer(self.canvas, self.choices)
 
     def start_agent_dialog(self, context: Dict[str, Any]):